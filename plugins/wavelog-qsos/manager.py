@@ -8,12 +8,16 @@ v2.1.0: Smooth scrolling ticker at 125 FPS with pre-rendered color-coded QSO dat
 """
 
 import logging
+import functools
+import hashlib
 import requests
 import time
 import json
 import re
+from collections import OrderedDict
+from itertools import zip_longest
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
@@ -24,6 +28,33 @@ logger = logging.getLogger(__name__)
 __version__ = "2.1.0"
 
 
+# Preformatted ages for the first 24h, indexed by minutes
+_AGE_STRS = (("now",) + tuple(f"{m}m" for m in range(1, 60))
+             + tuple(f"{m // 60}h{m % 60}m" for m in range(60, 24 * 60)))
+
+
+def _format_minutes(minutes: int) -> str:
+    """Compact age string for a QSO that is `minutes` old."""
+    if minutes < 1:
+        return "now"
+    if minutes < len(_AGE_STRS):
+        return _AGE_STRS[minutes]
+    return f"{minutes // 60}h{minutes % 60}m"
+
+
+@functools.lru_cache(maxsize=512)
+def _row_xoffsets(x: int, width: int, cw: int, sp: int,
+                  n_age: int, n_call: int, n_band: int, n_mode: int
+                  ) -> Tuple[int, int, int, int, int, int]:
+    """Field x positions for a Vegas QSO row, keyed by field lengths.
+    Returns (x_age, x_call, x_band, x_mode, x_country, country_max_chars)."""
+    x_call = x + n_age * cw + sp
+    x_band = x_call + n_call * cw + sp
+    x_mode = x_band + n_band * cw + sp
+    x_country = x_mode + n_mode * cw + sp
+    return x, x_call, x_band, x_mode, x_country, (width - x_country - 2) // cw
+
+
 class WavelogQSOsPlugin(BasePlugin):
     """
     Plugin to display recent QSOs from Wavelog on the LED matrix.
@@ -54,6 +85,10 @@ class WavelogQSOsPlugin(BasePlugin):
         "YB": "ID", "HS": "TH", "9M": "MY", "9V": "SG", "DU": "PH", "BV": "TW",
         "4X": "IL", "TA": "TR", "SU": "EG", "5Z": "KE", "5N": "NG", "CO": "CU",
     }
+    # Prefix table split by key length so _get_flag is a chain of dict probes
+    _PFX3 = {k: v for k, v in PREFIX_TO_ISO.items() if len(k) == 3}
+    _PFX2 = {k: v for k, v in PREFIX_TO_ISO.items() if len(k) == 2}
+    _PFX1 = {k: v for k, v in PREFIX_TO_ISO.items() if len(k) == 1}
     FLAG_WIDTH = 10
     FLAG_HEIGHT = 7
 
@@ -90,6 +125,11 @@ class WavelogQSOsPlugin(BasePlugin):
         # Vegas mode cards
         self.vegas_views = ["recent_qsos"]
         self.vegas_view_index = 0
+        self._vegas_cache: Optional[Tuple[str, List[Image.Image]]] = None  # (key, cards)
+        self._row_cache: "OrderedDict[Tuple, Image.Image]" = OrderedDict()  # LRU of row strips
+        self._row_cache_size = 128
+        self._row_height = UX.ROW2_Y - UX.ROW1_Y
+        self._trunc_cache: Dict[Tuple[str, int], str] = {}  # (country, max_chars) -> shown text
 
         # API state for incremental fetching
         self._cached_qsos = []
@@ -104,6 +144,10 @@ class WavelogQSOsPlugin(BasePlugin):
         self.time_color = UX.TIME_COLOR
         self.text_color = UX.TEXT_SECONDARY
 
+        # Band/mode color lookups (only a handful of distinct values per log)
+        self._band_color_cache: Dict[str, tuple] = {}
+        self._mode_color_cache: Dict[str, tuple] = {}
+
         # Layout constants (from shared UX constants)
         self.TITLE_Y = UX.TITLE_Y
         self.ROW1_Y = UX.ROW1_Y
@@ -114,6 +158,7 @@ class WavelogQSOsPlugin(BasePlugin):
 
         # Fonts (shared loader)
         self.font, self.font_large = load_fonts(__file__)
+        self._glyph_atlas: Dict[str, Tuple[Image.Image, int, float]] = {}  # char -> (mask, bearing, advance)
 
         # Flags (reuse from hamradio-spots)
         self.flags = {}
@@ -132,6 +177,13 @@ class WavelogQSOsPlugin(BasePlugin):
         self._ticker_loop_width = 0      # ticker_width + gap
         self._ticker_qso_hash = None     # Hash to detect QSO changes
 
+        # Age fields are repainted in place instead of rebuilding the ticker
+        self._age_slot_chars = max(len(_format_minutes(m))
+                                   for m in range(self.max_age_minutes + 10))
+        self._age_positions = []         # (x, segment_idx, age_text) per QSO
+        self._age_refresh_interval = 30  # seconds between age repaints
+        self._last_age_refresh = 0
+
         # Scroll state
         self._scroll_speed = self.config.get("scroll_speed", 50)  # pixels per second
         self._scroll_start = None        # time.time() when scroll phase started
@@ -175,12 +227,13 @@ class WavelogQSOsPlugin(BasePlugin):
         # Each QSO: [flag 10+3px] CALL SP BAND SP MODE SP AGE [separator]
         segments = []  # list of (text, color, has_flag, callsign)
         total_w = 0
+        now = datetime.now(timezone.utc)
 
         for i, qso in enumerate(self.qsos):
             call = qso["callsign"]
             band = qso["band"]
             mode = qso["mode"]
-            age = self._format_age(qso.get("_datetime_utc"))
+            age = self._format_age(qso.get("_datetime_utc"), now)
             country = qso.get("country", "")
 
             # Flag space
@@ -191,7 +244,8 @@ class WavelogQSOsPlugin(BasePlugin):
             call_w = len(call) * CW
             band_w = len(band) * CW
             mode_w = len(mode) * CW
-            age_w = len(age) * CW
+            # Fixed-width slot so the age can be repainted without re-layout
+            age_w = max(len(age), self._age_slot_chars) * CW
             country_short = country[:10] if country else ""
             country_w = len(country_short) * CW if country_short else 0
 
@@ -203,10 +257,13 @@ class WavelogQSOsPlugin(BasePlugin):
                 "callsign": call,
                 "band": band,
                 "mode": mode,
+                "band_color": qso["_band_color"],
+                "mode_color": qso["_mode_color"],
                 "age": age,
                 "country": country_short,
                 "flag": flag,
                 "flag_w": flag_w,
+                "age_w": age_w,
                 "width": qso_w,
             })
             total_w += qso_w
@@ -224,6 +281,7 @@ class WavelogQSOsPlugin(BasePlugin):
 
         x = 0
         text_y = 0  # Vertically centered in the 21px strip
+        age_positions = []
 
         for i, seg in enumerate(segments):
             # Flag
@@ -239,16 +297,17 @@ class WavelogQSOsPlugin(BasePlugin):
             x += len(seg["callsign"]) * CW + SP
 
             # Band (band color)
-            draw.text((x, text_y), seg["band"], font=self.font, fill=self._get_band_color(seg["band"]))
+            draw.text((x, text_y), seg["band"], font=self.font, fill=seg["band_color"])
             x += len(seg["band"]) * CW + SP
 
             # Mode (mode color)
-            draw.text((x, text_y), seg["mode"], font=self.font, fill=self._get_mode_color(seg["mode"]))
+            draw.text((x, text_y), seg["mode"], font=self.font, fill=seg["mode_color"])
             x += len(seg["mode"]) * CW + SP
 
-            # Age (gray)
+            # Age (gray) - position remembered for in-place repaints
             draw.text((x, text_y), seg["age"], font=self.font, fill=self.time_color)
-            x += len(seg["age"]) * CW
+            age_positions.append((x, i, seg["age"]))
+            x += seg["age_w"]
 
             # Country (dim)
             if seg["country"]:
@@ -264,11 +323,39 @@ class WavelogQSOsPlugin(BasePlugin):
         self._ticker_width = total_w
         self._ticker_loop_width = total_w + self._ticker_gap
         self._ticker_qso_hash = self._qso_hash()
+        self._age_positions = age_positions
+        self._last_age_refresh = time.time()
         self._scroll_start = time.time()
 
         self.logger.info(f"Built ticker image: {total_w}px wide, {len(self.qsos)} QSOs, "
                         f"loop_width={self._ticker_loop_width}px")
 
+    def _refresh_ticker_ages(self) -> None:
+        """Repaint only the age fields of the cached ticker image.
+        Falls back to a full rebuild if an age outgrows its reserved slot."""
+        if self._ticker_img is None or not self._age_positions:
+            return
+
+        CW = self.CHAR_WIDTH
+        slot_w = self._age_slot_chars * CW
+        draw = None
+        positions = []
+        now = datetime.now(timezone.utc)
+
+        for x, idx, old_age in self._age_positions:
+            age = self._format_age(self.qsos[idx].get("_datetime_utc"), now)
+            if age != old_age:
+                if len(age) > self._age_slot_chars:
+                    self._build_ticker_image()
+                    return
+                if draw is None:
+                    draw = ImageDraw.Draw(self._ticker_img)
+                draw.rectangle([x, 0, x + slot_w - 1, self._ticker_img.height - 1], fill=(0, 0, 0))
+                draw.text((x, 0), age, font=self.font, fill=self.time_color)
+            positions.append((x, idx, age))
+
+        self._age_positions = positions
+
     # =========================================================================
     # DISPLAY - STATELESS FRAME RENDERER (125 FPS)
     # =========================================================================
@@ -318,6 +405,11 @@ class WavelogQSOsPlugin(BasePlugin):
             self.enable_scrolling = False
             return True
 
+        # Keep the "Xm" ages current without rebuilding the whole ticker
+        if now - self._last_age_refresh >= self._age_refresh_interval:
+            self._last_age_refresh = now
+            self._refresh_ticker_ages()
+
         # Static title row
         draw.text((2, self.TITLE_Y), "WAVELOG", font=self.font, fill=self.title_color)
         count_text = f"{len(self.qsos)} QSO{'s' if len(self.qsos) != 1 else ''}"
@@ -397,6 +489,11 @@ class WavelogQSOsPlugin(BasePlugin):
                     recent.append(qso)
 
             self.qsos = recent[:self.max_qsos]
+
+            # Colors depend only on band/mode - resolve once per fetch, not per frame
+            for qso in self.qsos:
+                qso["_band_color"] = self._get_band_color(qso["band"])
+                qso["_mode_color"] = self._get_mode_color(qso["mode"])
             self.has_recent_qsos = len(self.qsos) > 0
 
             if self.has_recent_qsos:
@@ -437,6 +534,8 @@ class WavelogQSOsPlugin(BasePlugin):
             saveable_qsos = []
             for q in self._cached_qsos[:self.max_qsos * 2]:
                 sq = dict(q)
+                sq.pop("_band_color", None)
+                sq.pop("_mode_color", None)
                 dt = sq.get("_datetime_utc")
                 if dt:
                     sq["_datetime_utc_str"] = dt.isoformat()
@@ -722,10 +821,18 @@ class WavelogQSOsPlugin(BasePlugin):
     # =========================================================================
 
     def _get_mode_color(self, mode: str) -> tuple:
-        return get_mode_color(mode)
+        c = self._mode_color_cache.get(mode)
+        if c is None:
+            c = get_mode_color(mode)
+            self._mode_color_cache[mode] = c
+        return c
 
     def _get_band_color(self, band: str) -> tuple:
-        return get_band_color(band)
+        c = self._band_color_cache.get(band)
+        if c is None:
+            c = get_band_color(band)
+            self._band_color_cache[band] = c
+        return c
 
     def _load_flags(self):
         flags_dir = Path(__file__).parent.parent / "hamradio-spots" / "flags"
@@ -740,58 +847,99 @@ class WavelogQSOsPlugin(BasePlugin):
                 self.flags[code] = img
             except Exception as e:
                 self.logger.debug(f"Non-critical error: {e}")
-        self.logger.info(f"Loaded {len(self.flags)} country flags")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Loaded %d country flags", len(self.flags))
 
     def _get_flag(self, callsign: str) -> Optional[Image.Image]:
         if not callsign:
             return None
-        callsign = callsign.upper()
-        for length in range(min(3, len(callsign)), 0, -1):
-            prefix = callsign[:length]
-            if prefix in self.PREFIX_TO_ISO:
-                return self.flags.get(self.PREFIX_TO_ISO[prefix])
-        return None
+        # Callsigns are uppercased at ingest; only pay for .upper() on stray input
+        cs = callsign if callsign.isupper() else callsign.upper()
+        iso = self._PFX3.get(cs[:3]) or self._PFX2.get(cs[:2]) or self._PFX1.get(cs[:1])
+        return self.flags.get(iso) if iso else None
 
-    def _format_age(self, dt_utc: datetime) -> str:
+    def _format_age(self, dt_utc: datetime, now_utc: Optional[datetime] = None) -> str:
         if not dt_utc:
             return "?"
-        delta = datetime.now(timezone.utc) - dt_utc
-        minutes = int(delta.total_seconds() / 60)
-        if minutes < 1:
-            return "now"
-        elif minutes < 60:
-            return f"{minutes}m"
-        else:
-            return f"{minutes // 60}h{minutes % 60}m"
+        now_ts = now_utc.timestamp() if now_utc is not None else time.time()
+        return _format_minutes(int((now_ts - dt_utc.timestamp()) / 60))
 
     # =========================================================================
     # VEGAS MODE (static images - unchanged)
     # =========================================================================
 
-    def _draw_qso_row(self, draw: ImageDraw, qso: Dict, x: int, y: int, width: int) -> None:
-        """Draw a single QSO row for Vegas static cards."""
-        CW = self.CHAR_WIDTH
-        SP = self.SPACING
-
-        callsign = qso["callsign"]
-        band = qso["band"]
-        mode = qso["mode"]
-        age = self._format_age(qso.get("_datetime_utc"))
-        country = qso.get("country", "")
-
-        draw.text((x, y), age, font=self.font, fill=self.time_color)
-        x += len(age) * CW + SP
-        draw.text((x, y), callsign, font=self.font, fill=self.call_color)
-        x += len(callsign) * CW + SP
-        draw.text((x, y), band, font=self.font, fill=self._get_band_color(band))
-        x += len(band) * CW + SP
-        draw.text((x, y), mode, font=self.font, fill=self._get_mode_color(mode))
-        x += len(mode) * CW + SP
+    def _glyph(self, ch: str) -> Tuple[Image.Image, int, float]:
+        """Return (mask, x_bearing, advance) for one character, rasterizing it on first use."""
+        g = self._glyph_atlas.get(ch)
+        if g is None:
+            left, _, right, bottom = self.font.getbbox(ch)
+            bearing = min(left, 0)
+            mask = Image.new('L', (max(right - bearing, 1), max(bottom, 1)), 0)
+            ImageDraw.Draw(mask).text((-bearing, 0), ch, font=self.font, fill=255)
+            g = (mask, bearing, self.font.getlength(ch))
+            self._glyph_atlas[ch] = g
+        return g
+
+    def _blit_text(self, img: Image.Image, x: int, y: int, text: str, color: tuple) -> None:
+        """Draw text by pasting cached glyph masks instead of going through FreeType."""
+        glyph = self._glyph
+        paste = img.paste
+        pos = x
+        for ch in text:
+            mask, bearing, adv = glyph(ch)
+            paste(color, (int(pos) + bearing, y), mask)
+            pos += adv
+
+    def _draw_qso_row(self, img: Image.Image, qso: Dict, x: int, y: int, width: int,
+                      now: Optional[datetime] = None) -> None:
+        """Draw a single QSO row for Vegas static cards.
+        Rows are rendered once per (age, callsign, band, mode, country) and pasted."""
+        age = self._format_age(qso.get("_datetime_utc"), now)
+        key = (age, qso["callsign"], qso["band"], qso["mode"], qso.get("country", ""))
+
+        strip = self._row_cache.get(key)
+        if strip is None:
+            strip = Image.new('RGB', (width, self._row_height), (0, 0, 0))
+            self._render_qso_row(strip, key, qso["_band_color"], qso["_mode_color"], x, width)
+            self._row_cache[key] = strip
+            if len(self._row_cache) > self._row_cache_size:
+                self._row_cache.popitem(last=False)
+        else:
+            self._row_cache.move_to_end(key)
+
+        img.paste(strip, (0, y))
+
+    def _render_qso_row(self, img: Image.Image, fields: Tuple[str, str, str, str, str],
+                        band_color: tuple, mode_color: tuple, x: int, width: int) -> None:
+        """Render row fields (age, callsign, band, mode, country) at the top of img."""
+        blit = self._blit_text
+        tc = self.time_color
+        cc = self.call_color
+        td = UX.TEXT_DIM
+        trunc = self._trunc_cache
+
+        age, callsign, band, mode, country = fields
+        x_age, x_call, x_band, x_mode, x_country, max_chars = _row_xoffsets(
+            x, width, self.CHAR_WIDTH, self.SPACING, len(age), len(callsign), len(band), len(mode))
+
+        blit(img, x_age, 0, age, tc)
+        blit(img, x_call, 0, callsign, cc)
+        blit(img, x_band, 0, band, band_color)
+        blit(img, x_mode, 0, mode, mode_color)
         if country:
-            avail = width - x - 2
-            max_chars = avail // CW
-            c = country[:max_chars] if len(country) <= max_chars else country[:max(max_chars-1, 1)] + "."
-            draw.text((x, y), c, font=self.font, fill=UX.TEXT_DIM)
+            c = trunc.get((country, max_chars))
+            if c is None:
+                c = country[:max_chars] if len(country) <= max_chars else country[:max(max_chars-1, 1)] + "."
+                trunc[(country, max_chars)] = c
+            blit(img, x_country, 0, c, td)
+
+    def _vegas_cache_key(self, now: datetime) -> str:
+        """Digest of the QSO list plus each QSO's displayed age at `now`."""
+        h = hashlib.blake2b(digest_size=16)
+        for q in self.qsos:
+            age = self._format_age(q.get("_datetime_utc"), now)
+            h.update(f"{q['callsign']}|{q['band']}|{q['mode']}|{q.get('country', '')}|{age}\n".encode())
+        return h.hexdigest()
 
     def get_vegas_content(self) -> Optional[List[Image.Image]]:
         """Return static images for Vegas mode rotation."""
@@ -799,30 +947,40 @@ class WavelogQSOsPlugin(BasePlugin):
         if not self.has_recent_qsos:
             return None
 
+        # Cards only change when the QSO list or a displayed age changes
+        now = datetime.now(timezone.utc)
+        key = self._vegas_cache_key(now)
+        if self._vegas_cache is not None and self._vegas_cache[0] == key:
+            return list(self._vegas_cache[1])
+
         images = []
         W = self.DISPLAY_WIDTH
         H = UX.HEIGHT
 
-        # Generate cards showing 2 QSOs each
-        for start in range(0, len(self.qsos), 2):
-            img = Image.new('RGB', (W, H), (0, 0, 0))
-            draw = ImageDraw.Draw(img)
+        # Title + count are identical on every card - render them once
+        template = Image.new('RGB', (W, H), (0, 0, 0))
+        tdraw = ImageDraw.Draw(template)
+        tdraw.text((2, self.TITLE_Y), "WAVELOG", font=self.font, fill=self.title_color)
+        count_text = f"{len(self.qsos)} QSO{'s' if len(self.qsos) != 1 else ''}"
+        tdraw.text((text_right_x(count_text), self.TITLE_Y), count_text,
+                   font=self.font, fill=self.text_color)
 
-            # Title
-            draw.text((2, self.TITLE_Y), "WAVELOG", font=self.font, fill=self.title_color)
-            count_text = f"{len(self.qsos)} QSO{'s' if len(self.qsos) != 1 else ''}"
-            draw.text((text_right_x(count_text), self.TITLE_Y), count_text,
-                      font=self.font, fill=self.text_color)
+        # Generate cards showing 2 QSOs each (q2 is None on an odd last card).
+        # Fresh images per rebuild: callers may still hold earlier cards.
+        for q1, q2 in zip_longest(self.qsos[0::2], self.qsos[1::2]):
+            img = template.copy()
 
             # QSO rows
-            if start < len(self.qsos):
-                self._draw_qso_row(draw, self.qsos[start], 2, self.ROW1_Y, W)
-            if start + 1 < len(self.qsos):
-                self._draw_qso_row(draw, self.qsos[start + 1], 2, self.ROW2_Y, W)
+            self._draw_qso_row(img, q1, 2, self.ROW1_Y, W, now)
+            if q2 is not None:
+                self._draw_qso_row(img, q2, 2, self.ROW2_Y, W, now)
 
             images.append(img)
 
-        return images if images else None
+        if not images:
+            return None
+        self._vegas_cache = (key, images)
+        return list(images)
 
     def get_vegas_content_type(self) -> str:
         return 'static'
@@ -843,38 +1001,10 @@ class WavelogQSOsPlugin(BasePlugin):
         self.enable_scrolling = False
         self._ticker_img = None
         self._ticker_qso_hash = None
+        self._age_positions = []
+        self._vegas_cache = None
+        self._row_cache.clear()
         self._scroll_start = None
-        self.logger.info("Wavelog QSOs plugin cleaned up")
-
-
-# For direct testing
-if __name__ == "__main__":
-    logging.basicConfig(level=logging.DEBUG)
-
-    test_config = {
-        "enabled": True,
-        "wavelog_url": "http://localhost/wavelog",
-        "api_key": "",
-        "public_slug": "",
-        "fetch_method": "mysql",
-        "db_host": "localhost",
-        "db_name": "wavelog",
-        "db_user": "wavelog",
-        "db_pass": "",
-        "station_id": 1,
-        "max_qsos": 10,
-        "max_age_minutes": 60,
-    }
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Wavelog QSOs plugin cleaned up")
 
-    plugin = WavelogQSOsPlugin("wavelog-qsos", test_config, None, None, None)
-    print("Testing Wavelog fetch (will fail without DB/API)...")
-    try:
-        if test_config["fetch_method"] == "mysql":
-            qsos = plugin._fetch_mysql()
-        else:
-            qsos = plugin._fetch_api()
-        print(f"Fetched {len(qsos)} QSOs")
-        for q in qsos[:5]:
-            print(f"  {q['callsign']} {q['band']} {q['mode']} {q.get('_datetime_utc', '?')}")
-    except Exception as e:
-        print(f"Error: {e}")
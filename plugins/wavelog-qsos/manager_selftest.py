@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the Wavelog QSOs plugin fetch path.
+
+Usage (from the plugin directory, with LEDMatrix on PYTHONPATH):
+  python3 manager_selftest.py
+"""
+import logging
+
+from manager import WavelogQSOsPlugin
+
+
+def main():
+    logging.basicConfig(level=logging.DEBUG)
+
+    test_config = {
+        "enabled": True,
+        "wavelog_url": "http://localhost/wavelog",
+        "api_key": "",
+        "public_slug": "",
+        "fetch_method": "mysql",
+        "db_host": "localhost",
+        "db_name": "wavelog",
+        "db_user": "wavelog",
+        "db_pass": "",
+        "station_id": 1,
+        "max_qsos": 10,
+        "max_age_minutes": 60,
+    }
+
+    plugin = WavelogQSOsPlugin("wavelog-qsos", test_config, None, None, None)
+    print("Testing Wavelog fetch (will fail without DB/API)...")
+    try:
+        if test_config["fetch_method"] == "mysql":
+            qsos = plugin._fetch_mysql()
+        else:
+            qsos = plugin._fetch_api()
+        print(f"Fetched {len(qsos)} QSOs")
+        for q in qsos[:5]:
+            print(f"  {q['callsign']} {q['band']} {q['mode']} {q.get('_datetime_utc', '?')}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,24 +10,39 @@ TIER 3 (advisories, statements)            -> 1 info card in Vegas rotation
 v2.5.0: T2 no longer takes over display permanently. Runs one ticker cycle
         then cools off for 30 min. Summary card stays in Vegas rotation.
 """
+import hashlib
 import logging
-import requests
 import time
 import json
 import os
 import re
-from datetime import datetime, timezone, timedelta
+import textwrap
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from src.plugin_system.base_plugin import BasePlugin
 from ux_constants import UX, load_fonts
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # Optional C parser for the test/cache files
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 __version__ = "2.5.0"
 
 PRIORITY_FILE = "/tmp/ledmatrix_weather_alert_active"
 
+# Clock for animation, throttling and T2 cooldown - immune to NTP steps.
+# Wall-clock time.time() is kept only for NWS fetch cadence and expiry math.
+_now = time.monotonic
+
+_RE_DOTS = re.compile(r'\.\.\.+')
+_RE_WS = re.compile(r'\s+')
+
 
 class WeatherAlertsPlugin(BasePlugin):
     """NWS Weather Alerts - tiered response with readable text layout"""
@@ -37,7 +52,7 @@ class WeatherAlertsPlugin(BasePlugin):
     CHAR_W = UX.CHAR_ADVANCE
     MARGIN = 4
     BORDER_PX = 2
-    CHARS_PER_LINE = 30
+    CHARS_PER_LINE = UX.CHARS_PER_LINE
     ROW1 = 2
     ROW2 = 12
     ROW3 = 22
@@ -125,8 +140,12 @@ class WeatherAlertsPlugin(BasePlugin):
         self.last_fetch = 0
         self.alert_active = False
         self.has_tier1 = self.has_tier2 = self.has_tier3 = False
+        self._tier_counts = [0, 0, 0, 0]     # alerts per tier, index 0 unused
+        self._alerts_by_tier = [[], [], [], []]
         self.fetch_errors = 0
         self.test_active = False
+        self._test_mtime = 0         # mtime of last parsed test file
+        self._alerts_digest = None   # digest of last alerts.json payload written
 
         # Controller checks this for 125 FPS
         self.enable_scrolling = False
@@ -134,17 +153,41 @@ class WeatherAlertsPlugin(BasePlugin):
         # Ticker state (shared for T1 and T2)
         self._ticker_text = ""
         self._ticker_width = 0
+        self._ticker_tile = None         # Pre-rendered text mask, pasted white at y=10
         self._gap_px = 80                # Gap between looping copies
         self._loop_width = 0             # ticker_width + gap
         self._cache_event = None
         self._scroll_start = None
+        # (event, areas, expires, remaining) -> (ticker_text, width_px, tile), small LRU
+        self._ticker_cache = OrderedDict()
+        self._ticker_cache_size = 8
+        self._chev_strip_cache = {}      # color -> [(bar_image, bar_y0), ...]
+        # Word wrap for card text; long words get their own line, never split
+        self._wrapper = textwrap.TextWrapper(width=self.CHARS_PER_LINE,
+                                             break_long_words=False,
+                                             break_on_hyphens=False)
 
         # T2 periodic cycle state
         self._t2_cycle_active = False
-        self._t2_last_cycle_end = 0       # Timestamp when last T2 cycle finished
+        self._t2_next_eligible = 0.0      # _now() after which the next T2 cycle may start
         self._t2_cooldown = self.config.get("t2_cooldown", 1800)  # 30 min default
         self._t2_cycle_start = None
 
+        # Double-buffered frame canvases for display()
+        self._bufs = [Image.new("RGB", (self.W, self.H), (0, 0, 0)) for _ in range(2)]
+        self._draws = [ImageDraw.Draw(b) for b in self._bufs]
+        self._buf_idx = 0
+        # Ticker frames: chevron strips cover rows 0-9 and 23-31, this covers the rest
+        self._ticker_band = Image.new("RGB", (self.W, 13), (0, 0, 0))
+        self._last_frame_sig = None      # Signature of the frame on screen, None = repaint
+
+        # get_vegas_views() result, valid while self.alerts is the same list
+        self._vegas_views_cache = None
+        self._vegas_views_alerts_id = None
+        # (event, areas, expires, weight, test) -> (remaining, T1 Vegas frames)
+        self._t1_frame_cache = {}
+        self._remaining_cache = {}       # id(alert) -> (epoch second, remaining str, alert)
+
         # Throttle update() during high FPS
         self._last_update_time = 0
         self._update_throttle = 2.0      # Only call update() every 2s
@@ -163,6 +206,9 @@ class WeatherAlertsPlugin(BasePlugin):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.test_file = "/tmp/weather_alert_test.json"
 
+        # Persistent NWS session, created on first fetch (see _get_session)
+        self._session = None
+
         self.logger.info(f"WeatherAlerts v{__version__} init {self.latitude},{self.longitude}")
 
     # =========================================================================
@@ -193,54 +239,60 @@ class WeatherAlertsPlugin(BasePlugin):
         except Exception:
             return None
 
-    def _remaining(self, expires_str):
-        exp = self._parse_time(expires_str)
-        if not exp:
-            return "???"
-        d = exp - datetime.now(timezone.utc)
-        if d.total_seconds() <= 0:
-            return "EXPIRED"
-        h = int(d.total_seconds() // 3600)
-        m = int((d.total_seconds() % 3600) // 60)
-        return f"{h}h{m:02d}m" if h else f"{m}min"
+    def _expires_ts(self, alert):
+        """Epoch seconds of alert expiry (None if unparseable), parsed once per alert."""
+        if "_expires_ts" not in alert:
+            exp = self._parse_time(alert.get("expires", ""))
+            alert["_expires_ts"] = exp.timestamp() if exp else None
+        return alert["_expires_ts"]
+
+    def _remaining(self, alert):
+        now_s = int(time.time())
+        hit = self._remaining_cache.get(id(alert))
+        if hit is not None and hit[0] == now_s and hit[2] is alert:
+            return hit[1]
+        exp = self._expires_ts(alert)
+        if exp is None:
+            rem = "???"
+        else:
+            d = exp - time.time()
+            if d <= 0:
+                rem = "EXPIRED"
+            else:
+                h = int(d // 3600)
+                m = int((d % 3600) // 60)
+                rem = f"{h}h{m:02d}m" if h else f"{m}min"
+        self._remaining_cache[id(alert)] = (now_s, rem, alert)  # ref pins the id
+        return rem
 
     def _clean_nws_text(self, text):
         if not text:
             return ""
-        text = re.sub(r'\.\.\.+', '. ', text)
+        text = _RE_DOTS.sub('. ', text)
         text = text.replace("*", "")
         text = text.replace("\n\n", " ")
         text = text.replace("\n", " ")
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WS.sub(' ', text)
         text = text.strip()
         return text
 
     def _wrap(self, text, width=None):
-        if width is None:
-            width = self.CHARS_PER_LINE
         text = self._clean_nws_text(text)
         if not text:
             return []
-        lines = []
-        words = text.split()
-        current = ""
-        for word in words:
-            if not current:
-                current = word
-            elif len(current) + 1 + len(word) <= width:
-                current += " " + word
-            else:
-                lines.append(current)
-                current = word
-        if current:
-            lines.append(current)
-        return lines
+        if width is None or width == self._wrapper.width:
+            return self._wrapper.wrap(text)
+        return textwrap.wrap(text, width, break_long_words=False, break_on_hyphens=False)
+
+    def _text_width(self, s):
+        """Pixel width of s in the regular font (exact for proportional fonts)."""
+        return int(self.font.getlength(s))
 
     def _cx(self, text):
-        return max(self.MARGIN, (self.W - len(text) * self.CHAR_W) // 2)
+        return max(self.MARGIN, (self.W - self._text_width(text)) // 2)
 
     def _rx(self, text):
-        return max(self.MARGIN, self.W - self.MARGIN - len(text) * self.CHAR_W)
+        return max(self.MARGIN, self.W - self.MARGIN - self._text_width(text))
 
     def _stamp_test(self, draw):
         if not self.test_active:
@@ -262,25 +314,52 @@ class WeatherAlertsPlugin(BasePlugin):
             return False
         return True
 
+    def _get_session(self):
+        """Lazily import requests and build the NWS session - keeps the TLS
+        connection warm between fetches, and plugin load free of the import."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            self._session = requests.Session()
+            self._session.headers.update({
+                "User-Agent": "(LEDMatrix Weather Alerts, jwussler@gmail.com)",
+                "Accept": "application/geo+json",
+            })
+            self._session.mount("https://", HTTPAdapter(
+                pool_connections=1, pool_maxsize=1,
+                # Retry connection failures only - a read retry would multiply
+                # the 15s stall on the render thread
+                max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.3)))
+        return self._session
+
     def update(self):
         now = time.time()
 
-        if os.path.exists(self.test_file):
+        try:
+            test_mtime = os.stat(self.test_file).st_mtime
+        except FileNotFoundError:
+            test_mtime = 0
+
+        if test_mtime:
+            if test_mtime == self._test_mtime and self.test_active:
+                return  # Test file unchanged since last parse
             try:
-                with open(self.test_file, "r") as f:
-                    self.alerts = json.load(f)
+                with open(self.test_file, "rb") as f:
+                    self.alerts = _json_loads(f.read())
                 for a in self.alerts:
                     a["_tier"] = self._get_tier(a)
                     a["_weight"] = self._get_weight(a)
+                    self._expires_ts(a)
                 self.alerts.sort(key=lambda al: (al["_tier"], -al["_weight"]))
                 self.test_active = True
+                self._test_mtime = test_mtime
                 self._update_flags()
                 self._manage_priority_file()
+                counts = self._tier_counts
                 self.logger.info(f"TEST: {len(self.alerts)} alerts "
-                           f"T1:{sum(1 for a in self.alerts if a['_tier']==1)} "
-                           f"T2:{sum(1 for a in self.alerts if a['_tier']==2)} "
-                           f"T3:{sum(1 for a in self.alerts if a['_tier']==3)} "
-                           f"Weights:{[a.get('_weight',0) for a in self.alerts if a['_tier']==1]}")
+                           f"T1:{counts[1]} T2:{counts[2]} T3:{counts[3]} "
+                           f"Weights:{[a.get('_weight',0) for a in self._alerts_by_tier[1]]}")
                 return
             except Exception as e:
                 self.logger.error(f"Test load error: {e}")
@@ -292,11 +371,7 @@ class WeatherAlertsPlugin(BasePlugin):
 
         try:
             url = f"https://api.weather.gov/alerts/active?point={self.latitude},{self.longitude}"
-            headers = {
-                "User-Agent": "(LEDMatrix Weather Alerts, jwussler@gmail.com)",
-                "Accept": "application/geo+json",
-            }
-            resp = requests.get(url, headers=headers, timeout=15)
+            resp = self._get_session().get(url, timeout=15)
             resp.raise_for_status()
 
             self.alerts = []
@@ -317,6 +392,7 @@ class WeatherAlertsPlugin(BasePlugin):
                 }
                 a["_tier"] = self._get_tier(a)
                 a["_weight"] = self._get_weight(a)
+                self._expires_ts(a)
                 self.alerts.append(a)
 
             sev_ord = {"Extreme": 0, "Severe": 1, "Moderate": 2, "Minor": 3, "Unknown": 4}
@@ -327,8 +403,12 @@ class WeatherAlertsPlugin(BasePlugin):
             self._manage_priority_file()
 
             try:
-                with open(self.cache_dir / "alerts.json", "w") as f:
-                    json.dump(self.alerts, f)
+                payload = json.dumps(self.alerts)
+                digest = hashlib.blake2b(payload.encode(), digest_size=8).digest()
+                if digest != self._alerts_digest:  # Spare the SD card identical rewrites
+                    with open(self.cache_dir / "alerts.json", "w") as f:
+                        f.write(payload)
+                    self._alerts_digest = digest
             except Exception as e:
                 self.logger.debug(f"Non-critical error: {e}")
 
@@ -342,33 +422,47 @@ class WeatherAlertsPlugin(BasePlugin):
             self.logger.error(f"NWS error ({self.fetch_errors}): {e}")
             if not self.alerts:
                 try:
-                    with open(self.cache_dir / "alerts.json", "r") as f:
-                        self.alerts = json.load(f)
+                    with open(self.cache_dir / "alerts.json", "rb") as f:
+                        self.alerts = _json_loads(f.read())
                     for a in self.alerts:
                         a["_tier"] = self._get_tier(a)
                         a["_weight"] = self._get_weight(a)
+                        self._expires_ts(a)
                     self._update_flags()
                 except Exception as e:
                     self.logger.debug(f"Non-critical error: {e}")
 
     def _update_flags(self):
-        self.has_tier1 = any(a["_tier"] == 1 for a in self.alerts)
-        self.has_tier2 = any(a["_tier"] == 2 for a in self.alerts)
-        self.has_tier3 = any(a["_tier"] == 3 for a in self.alerts)
+        # One pass: bucket alerts by tier (index 0 unused), keeping sort order
+        per_tier = [[], [], [], []]
+        for a in self.alerts:
+            per_tier[a["_tier"]].append(a)
+        self._alerts_by_tier = per_tier
+        self._tier_counts = [len(b) for b in per_tier]
+        self.has_tier1 = self._tier_counts[1] > 0
+        self.has_tier2 = self._tier_counts[2] > 0
+        self.has_tier3 = self._tier_counts[3] > 0
         self.alert_active = len(self.alerts) > 0
 
         # T1 always scrolls. T2 scrolls only during active cycle.
         self.enable_scrolling = self.has_tier1 or self._t2_cycle_active
+        self._vegas_views_cache = None
+        self._t1_frame_cache.clear()
+        self._remaining_cache.clear()
 
     def _manage_priority_file(self):
         if self.has_tier1 or self._t2_cycle_active:
             tier = 1 if self.has_tier1 else 2
+            payload = json.dumps({"active": True, "tier": tier,
+                                  "events": [a["event"] for a in self.alerts
+                                             if a["_tier"] <= 2]}).encode()
             try:
-                with open(PRIORITY_FILE, "w") as f:
-                    json.dump({"active": True, "tier": tier,
-                               "events": [a["event"] for a in self.alerts
-                                          if a["_tier"] <= 2]}, f)
-                os.chmod(PRIORITY_FILE, 0o666)
+                fd = os.open(PRIORITY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    os.write(fd, payload)
+                    os.fchmod(fd, 0o666)  # open() mode is masked by umask
+                finally:
+                    os.close(fd)
             except Exception as e:
                 self.logger.debug(f"Non-critical error: {e}")
         else:
@@ -388,25 +482,22 @@ class WeatherAlertsPlugin(BasePlugin):
             return False  # T1 takes priority
         if self._t2_cycle_active:
             return False  # Already running
-        now = time.time()
-        # First cycle starts immediately, subsequent ones after cooldown
-        if self._t2_last_cycle_end == 0:
-            return True
-        return (now - self._t2_last_cycle_end) >= self._t2_cooldown
+        # First cycle starts immediately (deadline 0), subsequent ones after cooldown
+        return _now() >= self._t2_next_eligible
 
     def _start_t2_cycle(self):
         """Begin a T2 ticker cycle."""
         self._t2_cycle_active = True
-        self._t2_cycle_start = time.time()
-        self._scroll_start = time.time()
+        self._t2_cycle_start = self._scroll_start = _now()
         self._cache_event = None  # Force ticker rebuild
         self.enable_scrolling = True
+        self._manage_priority_file()
         self.logger.info("T2 ticker cycle STARTING")
 
     def _end_t2_cycle(self):
         """End a T2 ticker cycle, enter cooldown."""
         self._t2_cycle_active = False
-        self._t2_last_cycle_end = time.time()
+        self._t2_next_eligible = _now() + self._t2_cooldown
         self._t2_cycle_start = None
         self._scroll_start = None
         self._cache_event = None
@@ -434,19 +525,33 @@ class WeatherAlertsPlugin(BasePlugin):
     # =========================================================================
     # CHEVRON STRIPES (animated diagonal stripes)
     # =========================================================================
-    def _draw_chevron_stripes(self, draw, now, color):
+    def _chevron_strips(self, color):
+        """Pre-rendered (top, bottom) stripe bars for one color, 12px wider than
+        the display. The pattern repeats every 12px, so any animation offset is
+        a shifted paste of the same strip."""
+        strips = self._chev_strip_cache.get(color)
+        if strips is None:
+            strips = []
+            for bar_y0, bar_y1 in [(0, 9), (23, 32)]:
+                h = min(bar_y1, self.H - 1) - bar_y0 + 1
+                bar = Image.new("RGB", (self.W + 12, h), (0, 0, 0))
+                bdraw = ImageDraw.Draw(bar)
+                y1 = bar_y1 - bar_y0
+                for x in range(-12, self.W + 24, 12):
+                    pts1 = [(x, 0), (x + 6, 0), (x - 4, y1), (x - 10, y1)]
+                    pts2 = [(x + 6, 0), (x + 12, 0), (x + 2, y1), (x - 4, y1)]
+                    bdraw.polygon(pts1, fill=color)
+                    bdraw.polygon(pts2, fill=(0, 0, 0))
+                strips.append((bar, bar_y0))
+            self._chev_strip_cache[color] = strips
+        return strips
+
+    def _draw_chevron_stripes(self, img, now, color):
         """Animated diagonal stripes on top+bottom bars.
         color = stripe color, alternates with black."""
         offset = int(now * 60) % 12
-        for bar_y0, bar_y1 in [(0, 9), (23, 32)]:
-            for x in range(-12, self.W + 12, 12):
-                sx = x + offset
-                pts1 = [(sx, bar_y0), (sx + 6, bar_y0),
-                        (sx - 4, bar_y1), (sx - 10, bar_y1)]
-                pts2 = [(sx + 6, bar_y0), (sx + 12, bar_y0),
-                        (sx + 2, bar_y1), (sx - 4, bar_y1)]
-                draw.polygon(pts1, fill=color)
-                draw.polygon(pts2, fill=(0, 0, 0))
+        for bar, bar_y0 in self._chevron_strips(color):
+            img.paste(bar, (offset - 12, bar_y0))
 
     # =========================================================================
     # TICKER TEXT BUILDER
@@ -455,7 +560,7 @@ class WeatherAlertsPlugin(BasePlugin):
         """Build the single-line ticker string."""
         ev = self._short(alert["event"])
         areas = alert.get("areas", "")
-        rem = self._remaining(alert["expires"])
+        rem = self._remaining(alert)
         desc = self._clean_nws_text(alert.get("description", ""))
         inst = self._clean_nws_text(alert.get("instruction", "")
                                      or "Monitor conditions. Follow NWS guidance.")
@@ -467,6 +572,26 @@ class WeatherAlertsPlugin(BasePlugin):
                   f"ACTION: {inst}{sep}")
         return ticker
 
+    def _get_ticker(self, alert):
+        """Return (ticker_text, width_px, tile) for an alert, memoized per alert identity.
+        tile is the text pre-rendered as a mask, followed by the loop gap.
+        The remaining-time string is part of the key so it never goes stale."""
+        key = (alert.get("event", ""), alert.get("areas", ""), alert.get("expires", ""),
+               self._remaining(alert))
+        hit = self._ticker_cache.get(key)
+        if hit is not None:
+            self._ticker_cache.move_to_end(key)
+            return hit
+        text = self._build_ticker_text(alert)
+        width = self._text_width(text)
+        tile = Image.new("L", (width + self._gap_px, self.font.getbbox(text)[3] + 2), 0)
+        ImageDraw.Draw(tile).text((0, 2), text, font=self.font, fill=255)
+        hit = (text, width, tile)
+        self._ticker_cache[key] = hit
+        if len(self._ticker_cache) > self._ticker_cache_size:
+            self._ticker_cache.popitem(last=False)
+        return hit
+
     # =========================================================================
     # TIER 2 VEGAS CARD (summary)
     # =========================================================================
@@ -480,7 +605,7 @@ class WeatherAlertsPlugin(BasePlugin):
         areas = alert.get("areas", "")[:28]
         if areas:
             self._text(draw, 6, self.ROW2, areas, c["text"])
-        rem = self._remaining(alert["expires"])
+        rem = self._remaining(alert)
         self._text(draw, 6, self.ROW3, f"Until {rem}", (180, 180, 180))
 
     # =========================================================================
@@ -495,7 +620,7 @@ class WeatherAlertsPlugin(BasePlugin):
         if areas:
             self._text(draw, self.MARGIN, self.ROW2, areas[:self.CHARS_PER_LINE],
                       (200, 200, 200))
-        rem = self._remaining(alert["expires"])
+        rem = self._remaining(alert)
         self._text(draw, self.MARGIN, self.ROW3, f"Until {rem}", (120, 120, 120))
 
     # =========================================================================
@@ -512,17 +637,23 @@ class WeatherAlertsPlugin(BasePlugin):
     # =========================================================================
     def get_vegas_views(self) -> List[str]:
         """T2 and T3 alerts produce Vegas cards. T1 uses permanent takeover."""
-        if not self.alerts:
-            return ["clear:0:0"] if self.config.get("show_when_clear", False) else []
+        if (self._vegas_views_cache is not None
+                and self._vegas_views_alerts_id == id(self.alerts)):
+            return list(self._vegas_views_cache)
 
-        views = []
-        for i, alert in enumerate(self.alerts):
-            tier = alert.get("_tier", 3)
-            if tier == 2:
-                views.append(f"watch:{i}:0")
-            elif tier == 3:
-                views.append(f"info:{i}:0")
-        return views
+        if not self.alerts:
+            views = ["clear:0:0"] if self.config.get("show_when_clear", False) else []
+        else:
+            views = []
+            for i, alert in enumerate(self.alerts):
+                tier = alert.get("_tier", 3)
+                if tier == 2:
+                    views.append(f"watch:{i}:0")
+                elif tier == 3:
+                    views.append(f"info:{i}:0")
+        self._vegas_views_cache = views
+        self._vegas_views_alerts_id = id(self.alerts)
+        return list(views)
 
     def get_vegas_content(self) -> Optional[List[Image.Image]]:
         self.update()
@@ -534,25 +665,34 @@ class WeatherAlertsPlugin(BasePlugin):
         # T1: flood Vegas with warning cards (animated chevron frames)
         if self.has_tier1:
             images = []
-            t1_alerts = [a for a in self.alerts if a["_tier"] == 1]
+            t1_alerts = self._alerts_by_tier[1]
             for alert in t1_alerts:
                 weight = alert.get("_weight", 2)
+                rem = self._remaining(alert)
+                key = (alert.get("event", ""), alert.get("areas", ""), alert["expires"],
+                       weight, self.test_active)
+                cached = self._t1_frame_cache.get(key)
+                if cached is not None and cached[0] == rem:
+                    images.extend(cached[1])
+                    continue
+                frames = []
                 num_cards = max(6, weight * 4)  # 8-24 cards per alert
                 for frame in range(num_cards):
                     img = Image.new("RGB", (self.W, self.H), (0, 0, 0))
                     draw = ImageDraw.Draw(img)
                     # Animate chevrons across frames
-                    fake_time = time.time() + frame * 0.15
-                    self._draw_chevron_stripes(draw, fake_time, self.CHEVRON_COLORS[1])
+                    fake_time = _now() + frame * 0.15
+                    self._draw_chevron_stripes(img, fake_time, self.CHEVRON_COLORS[1])
                     # Black center band with warning text
                     draw.rectangle([0, 10, self.W, 22], fill=(0, 0, 0))
                     ev = self._short(alert["event"])
-                    rem = self._remaining(alert["expires"])
                     areas = alert.get("areas", "")[:24]
                     text = f"*** {ev} ***  {areas}  {rem}"
                     self._text(draw, self.MARGIN, 12, text[:self.CHARS_PER_LINE], (255, 255, 255))
                     self._stamp_test(draw)
-                    images.append(img)
+                    frames.append(img)
+                self._t1_frame_cache[key] = (rem, frames)  # Replaces stale countdown
+                images.extend(frames)
             self.logger.info(f"Vegas T1: {len(images)} warning cards for {len(t1_alerts)} alerts")
             return images if images else None
 
@@ -600,7 +740,7 @@ class WeatherAlertsPlugin(BasePlugin):
     def display(self, display_mode=None, force_clear=False):
         """Render ONE frame per call. No loops, no sleep."""
         # Throttle update() - don't read files 125x/sec
-        now = time.time()
+        now = _now()
         if now - self._last_update_time >= self._update_throttle:
             self.update()
             self._last_update_time = now
@@ -609,26 +749,52 @@ class WeatherAlertsPlugin(BasePlugin):
             if self._should_start_t2_cycle():
                 self._start_t2_cycle()
 
-        img = Image.new("RGB", (self.W, self.H), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        if force_clear:
+            self._last_frame_sig = None
+
+        # Alternate between two persistent canvases; the one handed to the
+        # display manager last frame is left untouched while we draw this one
+        self._buf_idx ^= 1
+        img = self._bufs[self._buf_idx]
+        draw = self._draws[self._buf_idx]
 
         if self.alerts:
             a = self.alerts[0]
             t = a.get("_tier", 3)
-            if t == 1:
-                # T1: permanent red chevron ticker
-                self._render_ticker_frame(img, draw, a, 1)
-            elif t == 2 and self._t2_cycle_active:
-                # T2: yellow chevron ticker (single cycle)
-                self._render_t2_ticker_frame(img, draw, a)
-            elif t == 2:
-                # T2 in cooldown: show static watch card
-                self._draw_watch_card(img, draw, a)
+            if t == 1 or (t == 2 and self._t2_cycle_active):
+                # T1: permanent red chevron ticker / T2: yellow single cycle
+                if t == 1:
+                    painted = self._render_ticker_frame(img, draw, a, 1)
+                else:
+                    painted = self._render_t2_ticker_frame(img, draw, a)
+                if not painted:
+                    # Same scroll + chevron step as the frame on screen
+                    self._buf_idx ^= 1
+                    return
             else:
-                self._draw_info_card(img, draw, a)
+                # T2 in cooldown: static watch card / T3: static info card.
+                # Only repaint when the card content actually changes.
+                sig = ("watch" if t == 2 else "info", a, self._remaining(a),
+                       self.test_active)
+                if sig == self._last_frame_sig:
+                    self._buf_idx ^= 1
+                    return
+                self._last_frame_sig = sig
+                draw.rectangle([0, 0, self.W, self.H], fill=(0, 0, 0))
+                if t == 2:
+                    self._draw_watch_card(img, draw, a)
+                else:
+                    self._draw_info_card(img, draw, a)
         elif self.config.get("show_when_clear", False):
+            sig = ("clear", self.test_active)
+            if sig == self._last_frame_sig:
+                self._buf_idx ^= 1
+                return
+            self._last_frame_sig = sig
+            draw.rectangle([0, 0, self.W, self.H], fill=(0, 0, 0))
             self._draw_clear(img, draw)
         else:
+            self._last_frame_sig = None
             return
 
         self._stamp_test(draw)
@@ -638,13 +804,12 @@ class WeatherAlertsPlugin(BasePlugin):
     def _render_ticker_frame(self, img, draw, alert, tier):
         """Render ONE frame of LOOPING scrolling ticker (for T1).
         Called at 125 FPS. Ticker loops seamlessly forever."""
-        now = time.time()
+        now = _now()
 
         # Build/cache ticker text
         event_key = alert.get("event", "") + alert.get("areas", "")
         if self._cache_event != event_key:
-            self._ticker_text = self._build_ticker_text(alert)
-            self._ticker_width = len(self._ticker_text) * self.CHAR_W
+            self._ticker_text, self._ticker_width, self._ticker_tile = self._get_ticker(alert)
             self._loop_width = self._ticker_width + self._gap_px
             self._cache_event = event_key
             self._scroll_start = now
@@ -655,45 +820,48 @@ class WeatherAlertsPlugin(BasePlugin):
 
         elapsed = now - self._scroll_start
 
+        # Scroll position: continuous loop using modulo
+        scroll_x = -(int(elapsed * self._scroll_speed) % self._loop_width)
+
+        # Nothing moved since the last pushed frame -> skip the repaint
+        sig = (tier, self._ticker_tile, scroll_x, int(now * 60) % 12)
+        if sig == self._last_frame_sig:
+            return False
+        self._last_frame_sig = sig
+
         # Get chevron color for this tier
         chevron_color = self.CHEVRON_COLORS.get(tier, (255, 0, 0))
 
         # Draw chevron stripes top + bottom
-        self._draw_chevron_stripes(draw, now, chevron_color)
+        self._draw_chevron_stripes(img, now, chevron_color)
 
-        # Black center band for ticker text
-        draw.rectangle([0, 10, self.W, 22], fill=(0, 0, 0))
+        # Black center band for ticker text (also clears last frame's text)
+        img.paste(self._ticker_band, (0, 10))
 
-        # Scroll position: continuous loop using modulo
-        scroll_x = -(int(elapsed * self._scroll_speed) % self._loop_width)
-
-        # Draw primary ticker text
-        draw.text((scroll_x, 12), self._ticker_text,
-                 font=self.font, fill=(255, 255, 255))
+        # Paste primary ticker text (pre-rendered, Pillow clips to the frame)
+        img.paste((255, 255, 255), (scroll_x, 10), self._ticker_tile)
 
-        # Draw second copy trailing behind to fill any gap
+        # Paste second copy trailing behind to fill any gap
         second_x = scroll_x + self._loop_width
         if second_x < self.W:
-            draw.text((second_x, 12), self._ticker_text,
-                     font=self.font, fill=(255, 255, 255))
+            img.paste((255, 255, 255), (second_x, 10), self._ticker_tile)
 
-        # Draw third copy if needed (for very short ticker text)
+        # Paste third copy if needed (for very short ticker text)
         third_x = second_x + self._loop_width
         if third_x < self.W:
-            draw.text((third_x, 12), self._ticker_text,
-                     font=self.font, fill=(255, 255, 255))
+            img.paste((255, 255, 255), (third_x, 10), self._ticker_tile)
+        return True
 
     def _render_t2_ticker_frame(self, img, draw, alert):
         """Render ONE frame of SINGLE-PASS ticker (for T2).
         Text enters from right, scrolls left, ends when fully off-screen left.
         Then cycle ends and display returns to Vegas rotation."""
-        now = time.time()
+        now = _now()
 
         # Build/cache ticker text
         event_key = "t2_" + alert.get("event", "") + alert.get("areas", "")
         if self._cache_event != event_key:
-            self._ticker_text = self._build_ticker_text(alert)
-            self._ticker_width = len(self._ticker_text) * self.CHAR_W
+            self._ticker_text, self._ticker_width, self._ticker_tile = self._get_ticker(alert)
             self._cache_event = event_key
             self._scroll_start = now
 
@@ -712,18 +880,26 @@ class WeatherAlertsPlugin(BasePlugin):
             # Cycle complete - release display
             self._end_t2_cycle()
             # Draw the static watch card for this frame
+            self._last_frame_sig = None
+            draw.rectangle([0, 0, self.W, self.H], fill=(0, 0, 0))
             self._draw_watch_card(img, draw, alert)
-            return
+            return True
+
+        # Nothing moved since the last pushed frame -> skip the repaint
+        sig = (2, self._ticker_tile, scroll_x, int(now * 60) % 12)
+        if sig == self._last_frame_sig:
+            return False
+        self._last_frame_sig = sig
 
         # Draw yellow chevron stripes top + bottom
-        self._draw_chevron_stripes(draw, now, self.CHEVRON_COLORS[2])
+        self._draw_chevron_stripes(img, now, self.CHEVRON_COLORS[2])
 
-        # Black center band for ticker text
-        draw.rectangle([0, 10, self.W, 22], fill=(0, 0, 0))
+        # Black center band for ticker text (also clears last frame's text)
+        img.paste(self._ticker_band, (0, 10))
 
-        # Draw ticker text
-        draw.text((scroll_x, 12), self._ticker_text,
-                 font=self.font, fill=(255, 255, 255))
+        # Paste pre-rendered ticker text
+        img.paste((255, 255, 255), (scroll_x, 10), self._ticker_tile)
+        return True
 
     # =========================================================================
     # LIFECYCLE + LIVE PRIORITY
@@ -735,13 +911,25 @@ class WeatherAlertsPlugin(BasePlugin):
     def cleanup(self):
         self.alerts = []
         self.alert_active = self.has_tier1 = self.has_tier2 = self.has_tier3 = False
+        self._tier_counts = [0, 0, 0, 0]
+        self._alerts_by_tier = [[], [], [], []]
         self.enable_scrolling = False
         self._ticker_text = ""
+        self._ticker_tile = None
+        self._ticker_cache.clear()
+        self._vegas_views_cache = None
+        self._t1_frame_cache.clear()
+        self._remaining_cache.clear()
         self._cache_event = None
         self._scroll_start = None
+        self._last_frame_sig = None
+        self._test_mtime = 0  # Force the test file to reload on next update()
         self._t2_cycle_active = False
-        self._t2_last_cycle_end = 0
+        self._t2_next_eligible = 0.0
         self._t2_cycle_start = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         try:
             os.remove(PRIORITY_FILE)
         except FileNotFoundError:
@@ -753,9 +941,7 @@ class WeatherAlertsPlugin(BasePlugin):
 
     def has_live_content(self) -> bool:
         """T1 always takes over. T2 takes over only during active cycle."""
-        if getattr(self, 'has_tier1', False):
-            return True
-        if getattr(self, '_t2_cycle_active', False):
+        if self.has_tier1 or self._t2_cycle_active:
             return True
         # Check if T2 cycle should start
         if self._should_start_t2_cycle():
@@ -22,6 +22,11 @@ import sys
 import os
 from datetime import datetime, timezone, timedelta
 
+try:
+    import orjson  # Optional: faster encoder, same output shape
+except ImportError:
+    orjson = None
+
 TEST_FILE = "/tmp/weather_alert_test.json"
 PRIORITY_FILE = "/tmp/ledmatrix_weather_alert_active"
 
@@ -29,9 +34,9 @@ PRIORITY_FILE = "/tmp/ledmatrix_weather_alert_active"
 def make_alert(event, severity, urgency, headline, description, instruction, hours_left=4):
     now = datetime.now(timezone.utc)
     return {
-        "event": event,
-        "severity": severity,
-        "urgency": urgency,
+        "event": sys.intern(event),
+        "severity": sys.intern(severity),
+        "urgency": sys.intern(urgency),
         "certainty": "Observed" if severity in ("Extreme", "Severe") else "Likely",
         "headline": headline,
         "description": description,
@@ -43,9 +48,10 @@ def make_alert(event, severity, urgency, headline, description, instruction, hou
     }
 
 
+# Built on demand so timestamps are fresh and unused scenarios cost nothing
 SCENARIOS = {
     # ===== TIER 1 - FULL TAKEOVER =====
-    "tornado": [
+    "tornado": lambda: [
         make_alert(
             "Tornado Warning", "Extreme", "Immediate",
             "Tornado Warning issued for Your County until 8:00 PM CST",
@@ -57,7 +63,7 @@ SCENARIOS = {
             hours_left=1,
         )
     ],
-    "severe": [
+    "severe": lambda: [
         make_alert(
             "Severe Thunderstorm Warning", "Severe", "Immediate",
             "Severe Thunderstorm Warning for Your County until 9:00 PM CST",
@@ -67,7 +73,7 @@ SCENARIOS = {
             hours_left=3,
         )
     ],
-    "flood": [
+    "flood": lambda: [
         make_alert(
             "Flash Flood Warning", "Severe", "Immediate",
             "Flash Flood Warning for Your County until 11:00 PM CST",
@@ -79,7 +85,7 @@ SCENARIOS = {
     ],
 
     # ===== TIER 2 - 3 CARDS =====
-    "watch": [
+    "watch": lambda: [
         make_alert(
             "Tornado Watch", "Severe", "Expected",
             "Tornado Watch for eastern Missouri until 10:00 PM CST",
@@ -89,7 +95,7 @@ SCENARIOS = {
             hours_left=6,
         )
     ],
-    "winter": [
+    "winter": lambda: [
         make_alert(
             "Winter Storm Warning", "Moderate", "Expected",
             "Winter Storm Warning in effect Friday evening through Saturday",
@@ -101,7 +107,7 @@ SCENARIOS = {
     ],
 
     # ===== TIER 3 - 1 CARD =====
-    "advisory": [
+    "advisory": lambda: [
         make_alert(
             "Wind Advisory", "Minor", "Expected",
             "Wind Advisory in effect until 6 PM CST Saturday",
@@ -112,7 +118,7 @@ SCENARIOS = {
     ],
 
     # ===== MIXED =====
-    "multi": [
+    "multi": lambda: [
         make_alert(
             "Tornado Warning", "Extreme", "Immediate",
             "Tornado Warning for Your County",
@@ -137,7 +143,7 @@ SCENARIOS = {
     ],
 
     # ===== DUAL T1 - shows priority weighting =====
-    "dual": [
+    "dual": lambda: [
         make_alert(
             "Tornado Warning", "Extreme", "Immediate",
             "Tornado Warning for Your County until 7:00 PM CST",
@@ -171,15 +177,20 @@ TIER_MAP = {
     "dual": "DUAL T1 - Tornado(w6) + SVR Tstorm(w2) - shows weighting",
 }
 
+# Interned keys: the argv lookup below compares by identity first
+SCENARIOS = {sys.intern(k): v for k, v in SCENARIOS.items()}
+TIER_MAP = {sys.intern(k): v for k, v in TIER_MAP.items()}
+
 
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
         return
 
-    cmd = sys.argv[1].lower()
+    cmd = sys.intern(sys.argv[1].lower())
 
     if cmd == "clear":
+        sudo_files = []
         for f in [TEST_FILE, PRIORITY_FILE]:
             try:
                 os.remove(f)
@@ -188,8 +199,12 @@ def main():
                 print(f"{f} already clear")
             except PermissionError:
                 # Priority file may be owned by root (ledmatrix service)
-                import subprocess
-                subprocess.run(["sudo", "rm", "-f", f])
+                sudo_files.append(f)
+        if sudo_files:
+            # One sudo call for everything we couldn't remove ourselves
+            import subprocess
+            subprocess.run(["sudo", "rm", "-f", *sudo_files])
+            for f in sudo_files:
                 print(f"Removed {f} (sudo)")
         print("\nTest alerts cleared!")
         print("Restart: sudo systemctl restart ledmatrix")
@@ -197,18 +212,19 @@ def main():
 
     if cmd == "status":
         print("=== Weather Alert Status ===")
-        if os.path.exists(TEST_FILE):
+        try:
             with open(TEST_FILE) as f:
                 alerts = json.load(f)
+        except FileNotFoundError:
+            print("No test alerts active")
+        else:
             print(f"TEST MODE: {len(alerts)} alert(s)")
             for a in alerts:
                 print(f"  {a['event']} ({a['severity']})")
-        else:
-            print("No test alerts active")
-        if os.path.exists(PRIORITY_FILE):
+        try:
             with open(PRIORITY_FILE) as f:
                 print(f"Priority: {json.load(f)}")
-        else:
+        except FileNotFoundError:
             print("Priority: inactive")
         return
 
@@ -217,9 +233,13 @@ def main():
         print(f"Options: {', '.join(list(SCENARIOS.keys()) + ['clear', 'status'])}")
         return
 
-    alerts = SCENARIOS[cmd]
-    with open(TEST_FILE, "w") as f:
-        json.dump(alerts, f, indent=2)
+    alerts = SCENARIOS[cmd]()
+    if orjson is not None:
+        with open(TEST_FILE, "wb") as f:
+            f.write(orjson.dumps(alerts, option=orjson.OPT_INDENT_2))
+    else:
+        with open(TEST_FILE, "w") as f:
+            json.dump(alerts, f, indent=2)
 
     print(f"Injected: {cmd} -> {TIER_MAP.get(cmd, '?')}")
     for a in alerts:
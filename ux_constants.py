@@ -12,6 +12,8 @@ Then import from any plugin:
 Version: 1.0.0
 """
 
+import os
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from typing import Tuple, Optional
@@ -45,7 +47,7 @@ class UX:
     BORDER_PX = 2
     FRAME_MARGIN = 4
     FRAME_INNER_WIDTH = WIDTH - 2 * BORDER_PX - 2 * FRAME_MARGIN  # 180px
-    CHARS_PER_LINE = 30  # FRAME_INNER_WIDTH // CHAR_ADVANCE
+    CHARS_PER_LINE = FRAME_INNER_WIDTH // CHAR_ADVANCE  # 30
 
     # =========================================================================
     # COLOR PALETTE - Shared across all plugins
@@ -55,6 +57,9 @@ class UX:
     TITLE_COLOR = (255, 200, 0)         # Warm yellow - standard header
     TITLE_COLOR_ALT = (0, 180, 255)     # Cyan-blue - alternate header
 
+    # --- Base colors ---
+    BLACK = (0, 0, 0)                   # Background / cleared pixels
+
     # --- Text colors ---
     TEXT_PRIMARY = (255, 255, 255)       # White
     TEXT_SECONDARY = (200, 200, 200)     # Light gray
@@ -140,18 +145,45 @@ class UX:
     EU_STAR_COLOR = (255, 204, 0)       # EU contest indicator
 
 
+def pack_color(color: tuple) -> int:
+    """
+    Pack an (r, g, b) tuple into the integer form Pillow accepts as a fill
+    for RGB images. Note Pillow's byte order: 0xBBGGRR, not 0xRRGGBB.
+    """
+    r, g, b = color
+    return r | (g << 8) | (b << 16)
+
+
+# Every plain (r, g, b) constant on UX, packed: PACKED_COLORS["TEXT_PRIMARY"]
+PACKED_COLORS = {
+    name: pack_color(value) for name, value in vars(UX).items()
+    if name.isupper() and isinstance(value, tuple) and len(value) == 3
+}
+
+
 # =============================================================================
 # FONT LOADING
 # =============================================================================
 
+# Resolved font path (None = PIL default) -> (font_regular, font_large).
+# Shared by every plugin so each TTF is parsed once per process.
+_FONT_CACHE = {}
+
+
 def load_fonts(plugin_file: str = None) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
     """
     Load standard fonts. Returns (font_regular, font_large).
+    Results are cached, so calling this per refresh is cheap.
 
     Args:
         plugin_file: __file__ from the calling plugin, used to locate fonts
                      relative to the plugin-repos directory.
     """
+    return _load_fonts_cached(plugin_file)
+
+
+@lru_cache(maxsize=8)
+def _load_fonts_cached(plugin_file: Optional[str]):
     font_paths = []
 
     # Try relative to plugin file first
@@ -167,41 +199,79 @@ def load_fonts(plugin_file: str = None) -> Tuple[ImageFont.FreeTypeFont, ImageFo
 
     for font_path in font_paths:
         if font_path.exists():
-            font = ImageFont.truetype(str(font_path), 8)
-            font_large = ImageFont.truetype(str(font_path), 10)
-            return font, font_large
+            key = str(font_path)
+            if key not in _FONT_CACHE:
+                _FONT_CACHE[key] = (ImageFont.truetype(key, 8), ImageFont.truetype(key, 10))
+            return _FONT_CACHE[key]
 
     # Last resort
-    font = ImageFont.load_default()
-    return font, font
+    if None not in _FONT_CACHE:
+        font = ImageFont.load_default()
+        _FONT_CACHE[None] = (font, font)
+    return _FONT_CACHE[None]
 
 
 # =============================================================================
 # DRAWING HELPERS
 # =============================================================================
 
-def new_image() -> Tuple[Image.Image, ImageDraw.Draw]:
-    """Create a new blank 192x32 RGB image and draw context."""
-    img = Image.new('RGB', (UX.WIDTH, UX.HEIGHT), (0, 0, 0))
+# (width, height) -> shared (img, draw) for new_image(reuse=True)
+_FRAME_CACHE = {}
+
+
+def new_image(reuse: bool = False) -> Tuple[Image.Image, ImageDraw.Draw]:
+    """
+    Create a new blank 192x32 RGB image and draw context.
+
+    With reuse=True, returns a shared per-size frame buffer cleared to black
+    instead of allocating. Only use it for a frame that is handed straight to
+    the display; never keep a reused image (e.g. in a Vegas image list).
+    """
+    if reuse:
+        key = (UX.WIDTH, UX.HEIGHT)
+        frame = _FRAME_CACHE.get(key)
+        if frame is None:
+            img = Image.new('RGB', key, UX.BLACK)
+            frame = _FRAME_CACHE[key] = (img, ImageDraw.Draw(img))
+        else:
+            clear_image(*frame)
+        return frame
+    img = Image.new('RGB', (UX.WIDTH, UX.HEIGHT), UX.BLACK)
     draw = ImageDraw.Draw(img)
     return img, draw
 
 
+def clear_image(img: Image.Image, draw: ImageDraw.Draw):
+    """Fill an existing image with black in place."""
+    draw.rectangle([0, 0, img.width, img.height], fill=UX.BLACK)
+
+
+@lru_cache(maxsize=512)
 def text_width(text: str) -> int:
     """Calculate pixel width of text string using standard char metrics."""
     return len(text) * UX.CHAR_WIDTH
 
 
+@lru_cache(maxsize=512)
 def text_right_x(text: str) -> int:
     """Calculate x position to right-align text with standard margin."""
     return UX.WIDTH - UX.MARGIN_RIGHT - len(text) * UX.CHAR_WIDTH
 
 
+@lru_cache(maxsize=512)
 def text_center_x(text: str) -> int:
     """Calculate x position to center text on display."""
     return max(UX.MARGIN_LEFT, (UX.WIDTH - len(text) * UX.CHAR_WIDTH) // 2)
 
 
+def _metrics(text: str, _cw=UX.CHAR_WIDTH, _w=UX.WIDTH,
+             _ml=UX.MARGIN_LEFT, _mr=UX.MARGIN_RIGHT) -> Tuple[int, int, int]:
+    """(width, right_x, center_x) for text in one pass. UX values are bound
+    as defaults so the hot path skips the class attribute lookups."""
+    n = len(text) * _cw
+    return n, _w - _mr - n, max(_ml, (_w - n) // 2)
+
+
 def draw_title_row(draw: ImageDraw.Draw, title: str, font: ImageFont.FreeTypeFont,
                    color: tuple = None, right_text: str = None,
                    right_color: tuple = None):
@@ -214,7 +284,7 @@ def draw_title_row(draw: ImageDraw.Draw, title: str, font: ImageFont.FreeTypeFon
     draw.text((UX.MARGIN_LEFT, UX.TITLE_Y), title, font=font, fill=color)
 
     if right_text:
-        rx = text_right_x(right_text)
+        _, rx, _ = _metrics(right_text)
         draw.text((rx, UX.TITLE_Y), right_text, font=font,
                   fill=right_color or UX.TEXT_SECONDARY)
 
@@ -239,11 +309,36 @@ def draw_text_center(draw: ImageDraw.Draw, y: int, text: str,
 
 def draw_border(draw: ImageDraw.Draw, color: tuple, thickness: int = 2):
     """Draw a border frame around the full display."""
-    for i in range(thickness):
-        draw.rectangle(
-            [i, i, UX.WIDTH - 1 - i, UX.HEIGHT - 1 - i],
-            outline=color
-        )
+    r, b, t = UX.WIDTH - 1, UX.HEIGHT - 1, thickness
+    if t <= 3:
+        # Thin borders: one outline stroke per ring is fewer Pillow calls
+        for i in range(t):
+            draw.rectangle([i, i, r - i, b - i], outline=color)
+        return
+    # Thick borders: four solid bars on Pillow's filled-rect path
+    draw.rectangle([0, 0, r, t - 1], fill=color)          # top
+    draw.rectangle([0, b - t + 1, r, b], fill=color)      # bottom
+    draw.rectangle([0, 0, t - 1, b], fill=color)          # left
+    draw.rectangle([r - t + 1, 0, r, b], fill=color)      # right
+
+
+# (color, thickness) -> black 192x32 frame with the border already drawn
+_BORDER_TEMPLATES = {}
+
+
+def border_template(color: tuple, thickness: int = 2) -> Image.Image:
+    """
+    Cached black frame with a border, for cards that redraw every tick.
+    img.paste(border_template(color)) clears the frame and draws the border
+    in one call. Treat the returned image as read-only.
+    """
+    key = (color, thickness)
+    tpl = _BORDER_TEMPLATES.get(key)
+    if tpl is None:
+        tpl = Image.new('RGB', (UX.WIDTH, UX.HEIGHT), UX.BLACK)
+        draw_border(ImageDraw.Draw(tpl), color, thickness)
+        _BORDER_TEMPLATES[key] = tpl
+    return tpl
 
 
 def advance_x(text: str, extra_gap: bool = False) -> int:
@@ -255,25 +350,29 @@ def advance_x(text: str, extra_gap: bool = False) -> int:
     return len(text) * UX.CHAR_WIDTH + spacing
 
 
+# Lookup tables normalized once so each color query is a single dict hit
+_BAND_LC = {k.lower(): v for k, v in UX.BAND_COLORS.items()}
+_MODE_UC = {k.upper(): v for k, v in UX.MODE_COLORS.items()}
+for _voice in ("USB", "LSB", "AM", "FM"):  # Voice modes share the SSB color
+    _MODE_UC.setdefault(_voice, UX.MODE_COLORS["SSB"])
+del _voice
+_SPONSOR_ITEMS = tuple(UX.SPONSOR_COLORS.items())
+
+
 def get_band_color(band: str) -> tuple:
     """Get standardized band color. Handles case-insensitive lookup."""
-    return UX.BAND_COLORS.get(band.lower(), (200, 200, 200))
+    return _BAND_LC.get(band.lower(), (200, 200, 200))
 
 
 def get_mode_color(mode: str) -> tuple:
     """Get standardized mode color. Handles case-insensitive lookup."""
-    m = mode.upper()
-    if m in UX.MODE_COLORS:
-        return UX.MODE_COLORS[m]
-    # Fuzzy fallback for voice modes
-    if m in ("SSB", "USB", "LSB", "AM", "FM"):
-        return UX.MODE_COLORS["SSB"]
-    return UX.TEXT_PRIMARY
+    return _MODE_UC.get(mode.upper(), UX.TEXT_PRIMARY)
 
 
 def get_sponsor_color(sponsor: str) -> tuple:
     """Get contest sponsor color."""
-    for key, color in UX.SPONSOR_COLORS.items():
-        if key in sponsor.upper():
+    s = sponsor.upper()
+    for key, color in _SPONSOR_ITEMS:
+        if key in s:
             return color
     return UX.TEXT_SECONDARY